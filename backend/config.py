@@ -15,3 +15,9 @@ GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY", "")
 # App
 APP_NAME = "encyclopedia-assistant"
 PORT = int(os.getenv("PORT", 8080))
+# Voice sessions kept in memory before the least recently used are evicted
+MAX_VOICE_SESSIONS = int(os.getenv("MAX_VOICE_SESSIONS", 1000))
+
+# Generated page cache
+PAGE_CACHE_TTL = int(os.getenv("PAGE_CACHE_TTL", 3600))
+PAGE_CACHE_MAX_MB = int(os.getenv("PAGE_CACHE_MAX_MB", 64))
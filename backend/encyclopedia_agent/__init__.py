@@ -1,3 +1,3 @@
-from backend.encyclopedia_agent.agent import root_agent
+from backend.encyclopedia_agent.agent import get_root_agent
 
-__all__ = ["root_agent"]
+__all__ = ["get_root_agent"]
@@ -1,16 +1,33 @@
-from google.adk.agents import Agent
+from functools import lru_cache
 
 from backend.config import LIVE_API_MODEL
 from backend.encyclopedia_agent.prompts import SYSTEM_INSTRUCTION
 from backend.encyclopedia_agent.tools import generate_encyclopedia_page
 
-root_agent = Agent(
-    name="encyclopedia_assistant",
-    model=LIVE_API_MODEL,
-    description=(
-        "An AI encyclopedia assistant that creates rich, illustrated visual "
-        "encyclopedia pages with diagrams and infographics from voice commands."
-    ),
-    instruction=SYSTEM_INSTRUCTION,
-    tools=[generate_encyclopedia_page],
-)
+
+@lru_cache(maxsize=1)
+def get_root_agent():
+    """Build the encyclopedia agent on first use.
+
+    Deferred so that importing the tools (e.g. for /api/generate) does not
+    pull in and construct the ADK agent stack.
+    """
+    from google.adk.agents import Agent
+
+    return Agent(
+        name="encyclopedia_assistant",
+        model=LIVE_API_MODEL,
+        description=(
+            "An AI encyclopedia assistant that creates rich, illustrated visual "
+            "encyclopedia pages with diagrams and infographics from voice commands."
+        ),
+        instruction=SYSTEM_INSTRUCTION,
+        tools=[generate_encyclopedia_page],
+    )
+
+
+def __getattr__(name: str):
+    # Keep `root_agent` resolvable for ADK tooling that looks it up by name
+    if name == "root_agent":
+        return get_root_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
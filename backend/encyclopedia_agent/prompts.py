@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 SYSTEM_INSTRUCTION = """You are an AI Encyclopedia Assistant that creates rich, visual encyclopedia pages.
 You listen to the user's voice and create immersive, illustrated knowledge pages about any topic.
 
@@ -24,7 +26,14 @@ INTERACTION STYLE:
 - If the user interrupts, immediately acknowledge and pivot to their new request
 """
 
-ENCYCLOPEDIA_GENERATION_PROMPT = """Generate a visual encyclopedia page about: {topic}
+
+@lru_cache(maxsize=1024)
+def build_generation_prompt(topic: str, focus: str) -> str:
+    """Page generation prompt, memoized so repeat topics reuse the same string.
+
+    An f-string avoids re-parsing a format template.
+    """
+    return f"""Generate a visual encyclopedia page about: {topic}
 Focus: {focus}
 
 Create interleaved text and images:
@@ -1,20 +1,119 @@
-import base64
+import asyncio
 import logging
+import sys
+from dataclasses import dataclass, field
+from typing import Callable
 
-from google import genai
-from google.genai import types
-
-from backend.config import IMAGE_GEN_MODEL, GOOGLE_API_KEY
-from backend.encyclopedia_agent.prompts import ENCYCLOPEDIA_GENERATION_PROMPT
+from backend.config import IMAGE_GEN_MODEL
+from backend.encyclopedia_agent.prompts import build_generation_prompt
 from backend.services.content_store import content_store
+from backend.services.genai_client import get_genai_client
+from backend.services.page_cache import page_cache
 
 logger = logging.getLogger(__name__)
 
-# Initialize a dedicated genai client for image generation
-_image_client = genai.Client(api_key=GOOGLE_API_KEY)
+# Share one string object per common image MIME type across all pages
+_MIME_INTERN = {
+    mime_type: sys.intern(mime_type)
+    for mime_type in ("image/png", "image/jpeg", "image/webp")
+}
+
+
+@dataclass(slots=True)
+class _Section:
+    """Accumulates one section while the response streams in."""
+
+    text_parts: list[str] = field(default_factory=list)
+    images: list[dict] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {"text": "".join(self.text_parts), "images": self.images}
+
+
+def _publish_section(
+    session_id: str, topic: str, focus: str, index: int, section: dict
+):
+    """Push a single finished section to content WebSocket subscribers."""
+    if session_id:
+        content_store.publish(
+            session_id,
+            {
+                "type": "section_delta",
+                "topic": topic,
+                "focus": focus,
+                "index": index,
+                "section": section,
+            },
+        )
 
 
-def generate_encyclopedia_page(
+def build_encyclopedia_page(
+    topic: str,
+    focus: str = "general overview",
+    on_section: Callable[[int, dict], None] | None = None,
+) -> dict:
+    """Generate an encyclopedia page and return it as structured page data.
+
+    Shared by the agent tool and the HTTP endpoint so each request makes a
+    single Gemini call. ``on_section`` is invoked with ``(index, section)``
+    as soon as each section is complete.
+    """
+    from google.genai import types
+
+    stream = get_genai_client().models.generate_content_stream(
+        model=IMAGE_GEN_MODEL,
+        contents=build_generation_prompt(topic, focus),
+        config=types.GenerateContentConfig(
+            response_modalities=["TEXT", "IMAGE"],
+            image_config=types.ImageConfig(
+                aspect_ratio="16:9",
+            ),
+        ),
+    )
+
+    # Process interleaved response into structured sections. Text arrives in
+    # many small streamed parts, so collect them and join once per section.
+    sections = []
+    current_section = _Section()
+
+    def finish_section():
+        section = current_section.to_dict()
+        sections.append(section)
+        if on_section:
+            on_section(len(sections) - 1, section)
+
+    for chunk in stream:
+        for part in chunk.parts or ():
+            if part.text is not None:
+                # If we already have images in the current section, start a new one
+                if current_section.images and current_section.text_parts:
+                    finish_section()
+                    current_section = _Section()
+                if part.text:
+                    current_section.text_parts.append(part.text)
+            elif part.inline_data is not None:
+                # Raw bytes; each transport decides how to encode them
+                mime_type = part.inline_data.mime_type or "image/png"
+                current_section.images.append(
+                    {
+                        "data": part.inline_data.data,
+                        "mime_type": _MIME_INTERN.get(mime_type, mime_type),
+                    }
+                )
+
+    # Don't forget the last section
+    if current_section.text_parts or current_section.images:
+        finish_section()
+
+    return {
+        "type": "encyclopedia_page",
+        "topic": topic,
+        "focus": focus,
+        "sections": sections,
+    }
+
+
+async def generate_encyclopedia_page(
     topic: str,
     focus: str = "general overview",
     tool_context=None,
@@ -44,58 +143,44 @@ def generate_encyclopedia_page(
         except Exception:
             pass
 
-    try:
-        prompt = ENCYCLOPEDIA_GENERATION_PROMPT.format(topic=topic, focus=focus)
-
-        response = _image_client.models.generate_content(
-            model=IMAGE_GEN_MODEL,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                response_modalities=["TEXT", "IMAGE"],
-                image_config=types.ImageConfig(
-                    aspect_ratio="16:9",
-                ),
-            ),
-        )
-
-        # Process interleaved response into structured sections
-        sections = []
-        current_section = {"text": "", "images": []}
-
-        for part in response.parts:
-            if part.text is not None:
-                # If we already have images in the current section, start a new one
-                if current_section["images"] and current_section["text"]:
-                    sections.append(current_section)
-                    current_section = {"text": "", "images": []}
-                current_section["text"] += part.text
-            elif part.inline_data is not None:
-                img_b64 = base64.b64encode(part.inline_data.data).decode("utf-8")
-                current_section["images"].append(
-                    {
-                        "data": img_b64,
-                        "mime_type": part.inline_data.mime_type or "image/png",
-                    }
-                )
+    loop = asyncio.get_running_loop()
 
-        # Don't forget the last section
-        if current_section["text"] or current_section["images"]:
-            sections.append(current_section)
-
-        page_data = {
-            "type": "encyclopedia_page",
-            "topic": topic,
-            "focus": focus,
-            "sections": sections,
-        }
+    def on_section(index: int, section: dict):
+        # Runs on the worker thread; the content store belongs to the loop
+        loop.call_soon_threadsafe(
+            _publish_section, session_id, topic, focus, index, section
+        )
 
-        # Publish to content WebSocket subscribers
-        if session_id:
-            content_store.publish(session_id, page_data)
+    try:
+        # Generate in a worker thread so the blocking SDK stream doesn't stall
+        # the voice session, publishing each section as it completes. Cached
+        # or concurrently generated pages are published in one go instead.
+        page_data, created = await page_cache.get_or_create(
+            topic,
+            focus,
+            lambda: asyncio.to_thread(build_encyclopedia_page, topic, focus, on_section),
+        )
+        if not created:
+            for index, section in enumerate(page_data["sections"]):
+                _publish_section(session_id, topic, focus, index, section)
 
+        sections = page_data["sections"]
         section_count = len(sections)
         image_count = sum(len(s["images"]) for s in sections)
 
+        # Tell content WebSocket subscribers the page is finished
+        if session_id:
+            content_store.publish(
+                session_id,
+                {
+                    "type": "encyclopedia_page_complete",
+                    "topic": topic,
+                    "focus": focus,
+                    "section_count": section_count,
+                    "image_count": image_count,
+                },
+            )
+
         return {
             "status": "success",
             "topic": topic,
@@ -108,7 +193,7 @@ def generate_encyclopedia_page(
         }
 
     except Exception as e:
-        logger.error(f"Encyclopedia generation failed: {e}", exc_info=True)
+        logger.error("Encyclopedia generation failed: %s", e, exc_info=True)
         return {
             "status": "error",
             "message": f"Failed to generate encyclopedia page: {str(e)}",
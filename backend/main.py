@@ -1,19 +1,56 @@
 import uvicorn
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.websockets import WebSocketClose
 
 from backend.config import PORT
+from backend.responses import OrjsonResponse
 from backend.routes.health import router as health_router
 from backend.routes.voice_ws import router as voice_router
 from backend.routes.content_ws import router as content_router
 from backend.routes.generate import router as generate_router
 from backend.routes.generate_video import router as video_router
 
-app = FastAPI(title="AI Encyclopedia Assistant")
 
-app.add_middleware(
+class RevalidatedStaticFiles(StaticFiles):
+    """StaticFiles that tells browsers to revalidate cached files each use.
+
+    Assets are not fingerprinted, so rather than a max-age they are cached
+    with "no-cache" and revalidated through the ETag Starlette already sets,
+    which turns repeat loads into 304s without serving stale code.
+    """
+
+    async def __call__(self, scope, receive, send):
+        # The root mount matches every path, WebSockets included; close those
+        # the way Starlette does for unmatched routes instead of asserting
+        if scope["type"] != "http":
+            await WebSocketClose()(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("Cache-Control", "no-cache")
+        return response
+
+
+app = FastAPI(
+    title="AI Encyclopedia Assistant",
+    default_response_class=OrjsonResponse,
+)
+
+# HTTP API, mounted under /api so only these routes go through CORS handling.
+# Mounted apps are left out of the main OpenAPI schema, and its own docs would
+# list the routes without the /api prefix, so its docs are disabled.
+api = FastAPI(
+    default_response_class=OrjsonResponse,
+    docs_url=None,
+    redoc_url=None,
+    openapi_url=None,
+)
+
+api.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
@@ -21,20 +58,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# API routes
+api.include_router(generate_router)
+api.include_router(video_router)
+
+# Top-level routes
 app.include_router(health_router)
 app.include_router(voice_router)
 app.include_router(content_router)
-app.include_router(generate_router)
-app.include_router(video_router)
-
-# Serve frontend static files
-app.mount("/static", StaticFiles(directory="frontend"), name="static")
-
+app.mount("/api", api)
 
-@app.get("/")
-async def serve_frontend():
-    return FileResponse("frontend/index.html")
+# Serve frontend static files; the root mount serves index.html and must
+# stay last since it matches every path
+app.mount("/static", RevalidatedStaticFiles(directory="frontend"), name="static")
+app.mount("/", RevalidatedStaticFiles(directory="frontend", html=True), name="frontend")
 
 
 if __name__ == "__main__":
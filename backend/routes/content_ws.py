@@ -1,6 +1,8 @@
-import json
+import asyncio
 import logging
+from uuid import uuid4
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from backend.services.content_store import content_store
@@ -8,6 +10,66 @@ from backend.services.content_store import content_store
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Binary frame layout: IMAGE_FRAME_PREFIX + ref + b"\x00" + raw image bytes
+IMAGE_FRAME_PREFIX = b"IMG\x00"
+
+# JSON messages published close together are sent as one batch frame
+FLUSH_BYTES = 16 * 1024
+FLUSH_SECONDS = 0.05
+
+
+def _to_json(message: dict) -> str:
+    """Encode a message for a text frame; orjson returns bytes, frames need str."""
+    return orjson.dumps(message).decode()
+
+
+class _Coalescer:
+    """Collects encoded JSON messages and sends them as a single frame."""
+
+    def __init__(self, websocket: WebSocket, flush_bytes: int = FLUSH_BYTES):
+        self._websocket = websocket
+        self._flush_bytes = flush_bytes
+        self._messages: list[str] = []
+        self._size = 0
+
+    def add(self, encoded: str) -> bool:
+        """Buffer a message. Returns True once the size budget is reached."""
+        self._messages.append(encoded)
+        self._size += len(encoded)
+        return self._size >= self._flush_bytes
+
+    async def flush(self):
+        """Send everything buffered, batching only when there is more than one."""
+        if not self._messages:
+            return
+        if len(self._messages) == 1:
+            frame = self._messages[0]
+        else:
+            frame = '{"type":"batch","messages":[' + ",".join(self._messages) + "]}"
+        self._messages = []
+        self._size = 0
+        await self._websocket.send_text(frame)
+
+
+def _extract_images(message: dict) -> tuple[dict, list[tuple[str, bytes]]]:
+    """Swap raw image bytes in a section message for refs.
+
+    Returns the JSON-safe message and the ``(ref, bytes)`` pairs that must be
+    sent as binary frames. Messages without a section pass through untouched.
+    """
+    section = message.get("section")
+    if not section or not section.get("images"):
+        return message, []
+
+    blobs = []
+    images = []
+    for img in section["images"]:
+        ref = f"img:{uuid4()}"
+        blobs.append((ref, img["data"]))
+        images.append({"ref": ref, "mime_type": img["mime_type"]})
+
+    return {**message, "section": {**section, "images": images}}, blobs
+
 
 @router.websocket("/ws/content/{session_id}")
 async def content_websocket(websocket: WebSocket, session_id: str):
@@ -16,19 +78,51 @@ async def content_websocket(websocket: WebSocket, session_id: str):
     The frontend connects here to receive rich visual content (text + images)
     generated by the encyclopedia tool. Content is published via the
     content_store pub/sub when the ADK agent's tool completes.
+
+    Images are sent as binary frames ahead of the JSON message that
+    references them, so they never pay base64 encoding.
     """
     await websocket.accept()
-    queue = content_store.subscribe(session_id)
-    logger.info(f"Content WebSocket connected for session: {session_id}")
+    subscription = content_store.subscribe(session_id)
+    coalescer = _Coalescer(websocket)
+    last_seq = None
+    loop = asyncio.get_running_loop()
+    logger.info("Content WebSocket connected for session: %s", session_id)
 
     try:
         while True:
-            # Wait for new encyclopedia content
-            page_data = await queue.get()
-            await websocket.send_text(json.dumps(page_data))
+            # Wait for new encyclopedia content, then keep collecting whatever
+            # else arrives within the flush window before sending
+            data = await subscription.get()
+            deadline = loop.time() + FLUSH_SECONDS
+            while True:
+                # Messages dropped under backpressure show up as a seq gap
+                seq = data.get("seq")
+                if seq is not None:
+                    if last_seq is not None and seq > last_seq + 1:
+                        coalescer.add(_to_json({
+                            "type": "gap",
+                            "dropped": seq - last_seq - 1,
+                        }))
+                    last_seq = seq
+                message, blobs = _extract_images(data)
+                for ref, blob in blobs:
+                    await websocket.send_bytes(
+                        IMAGE_FRAME_PREFIX + ref.encode() + b"\x00" + blob
+                    )
+                if coalescer.add(_to_json(message)):
+                    break
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    data = await asyncio.wait_for(subscription.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            await coalescer.flush()
     except WebSocketDisconnect:
-        logger.info(f"Content WebSocket disconnected for session: {session_id}")
+        logger.info("Content WebSocket disconnected for session: %s", session_id)
     except Exception as e:
-        logger.error(f"Content WebSocket error: {e}")
+        logger.error("Content WebSocket error: %s", e)
     finally:
-        content_store.unsubscribe(session_id, queue)
+        content_store.unsubscribe(session_id, subscription)
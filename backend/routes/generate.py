@@ -1,19 +1,52 @@
-import base64
+import asyncio
 import logging
 
+import orjson
+import pybase64
 from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from pydantic import BaseModel
-from google import genai
-from google.genai import types as genai_types
 
-from backend.config import IMAGE_GEN_MODEL, GOOGLE_API_KEY
-from backend.encyclopedia_agent.prompts import ENCYCLOPEDIA_GENERATION_PROMPT
+from backend.config import IMAGE_GEN_MODEL
+from backend.encyclopedia_agent.prompts import build_generation_prompt
+from backend.encyclopedia_agent.tools import build_encyclopedia_page
+from backend.responses import OrjsonResponse
+from backend.services.genai_client import get_genai_client
+from backend.services.page_cache import page_cache
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-_client = genai.Client(api_key=GOOGLE_API_KEY)
+
+def _encode_images(page_data: dict) -> dict:
+    """Return a JSON-safe copy of page_data with image bytes base64-encoded."""
+    return {
+        **page_data,
+        "sections": [
+            {
+                **section,
+                "images": [
+                    {**img, "data": pybase64.b64encode(img["data"]).decode("ascii")}
+                    for img in section["images"]
+                ],
+            }
+            for section in page_data["sections"]
+        ],
+    }
+
+
+def _render_page(page_data: dict, topic: str, focus: str) -> bytes:
+    """Serialize a page for the /generate response body.
+
+    Base64 and JSON encoding of multi-image pages is CPU-heavy, so this runs
+    in a worker thread rather than on the event loop.
+    """
+    return orjson.dumps({
+        **_encode_images(page_data),
+        "status": "success",
+        "topic": topic,
+        "focus": focus,
+    })
 
 
 class GenerateRequest(BaseModel):
@@ -22,90 +55,59 @@ class GenerateRequest(BaseModel):
     session_id: str = ""
 
 
-@router.post("/api/generate")
+@router.post("/generate", response_class=OrjsonResponse)
 async def generate_page(request: GenerateRequest):
     """Generate an encyclopedia page with interleaved text + images."""
-    logger.info(f"Generate request: topic={request.topic}, focus={request.focus}")
+    logger.info("Generate request: topic=%s, focus=%s", request.topic, request.focus)
 
     try:
-        prompt = ENCYCLOPEDIA_GENERATION_PROMPT.format(
-            topic=request.topic, focus=request.focus
-        )
-
-        response = _client.models.generate_content(
-            model=IMAGE_GEN_MODEL,
-            contents=prompt,
-            config=genai_types.GenerateContentConfig(
-                response_modalities=["TEXT", "IMAGE"],
-                image_config=genai_types.ImageConfig(aspect_ratio="16:9"),
+        page_data, _ = await page_cache.get_or_create(
+            request.topic,
+            request.focus,
+            lambda: asyncio.to_thread(
+                build_encyclopedia_page, request.topic, request.focus
             ),
         )
-
-        sections = []
-        current_section = {"text": "", "images": []}
-
-        for part in response.parts:
-            if part.text is not None:
-                if current_section["images"] and current_section["text"]:
-                    sections.append(current_section)
-                    current_section = {"text": "", "images": []}
-                current_section["text"] += part.text
-            elif part.inline_data is not None:
-                img_b64 = base64.b64encode(part.inline_data.data).decode("utf-8")
-                current_section["images"].append({
-                    "data": img_b64,
-                    "mime_type": part.inline_data.mime_type or "image/png",
-                })
-
-        if current_section["text"] or current_section["images"]:
-            sections.append(current_section)
-
-        page_data = {
-            "type": "encyclopedia_page",
-            "status": "success",
-            "topic": request.topic,
-            "focus": request.focus,
-            "sections": sections,
-        }
+        sections = page_data["sections"]
 
         logger.info(
-            f"Generated: {len(sections)} sections, "
-            f"{sum(len(s['images']) for s in sections)} images"
+            "Generated: %d sections, %d images",
+            len(sections),
+            sum(len(s["images"]) for s in sections),
         )
 
-        return JSONResponse(content=page_data)
+        body = await asyncio.to_thread(
+            _render_page, page_data, request.topic, request.focus
+        )
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
-        logger.error(f"Generate endpoint error: {e}", exc_info=True)
-        return JSONResponse(
+        logger.error("Generate endpoint error: %s", e, exc_info=True)
+        return OrjsonResponse(
             content={"status": "error", "message": str(e)},
             status_code=500,
         )
 
 
-@router.post("/api/generate-text")
+@router.post("/generate-text", response_class=OrjsonResponse)
 async def generate_text_only(request: GenerateRequest):
     """Generate TEXT-ONLY encyclopedia content (fast, ~2s).
     Used for instant page rendering before images load."""
-    logger.info(f"Text-only request: topic={request.topic}")
+    logger.info("Text-only request: topic=%s", request.topic)
 
     try:
-        prompt = ENCYCLOPEDIA_GENERATION_PROMPT.format(
-            topic=request.topic, focus=request.focus
-        )
+        from google.genai import types as genai_types
 
-        response = _client.models.generate_content(
+        response = await asyncio.to_thread(
+            get_genai_client().models.generate_content,
             model=IMAGE_GEN_MODEL,
-            contents=prompt,
+            contents=build_generation_prompt(request.topic, request.focus),
             config=genai_types.GenerateContentConfig(
                 response_modalities=["TEXT"],
             ),
         )
 
-        text = ""
-        for part in response.parts:
-            if part.text:
-                text += part.text
+        text = "".join(part.text for part in response.parts if part.text)
 
         # Split into sections by headings
         sections = []
@@ -114,7 +116,7 @@ async def generate_text_only(request: GenerateRequest):
             if block:
                 sections.append({"text": block, "images": []})
 
-        return JSONResponse(content={
+        return OrjsonResponse(content={
             "type": "encyclopedia_page",
             "status": "success",
             "topic": request.topic,
@@ -124,8 +126,8 @@ async def generate_text_only(request: GenerateRequest):
         })
 
     except Exception as e:
-        logger.error(f"Text-only generation error: {e}", exc_info=True)
-        return JSONResponse(
+        logger.error("Text-only generation error: %s", e, exc_info=True)
+        return OrjsonResponse(
             content={"status": "error", "message": str(e)},
             status_code=500,
         )
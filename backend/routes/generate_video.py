@@ -1,20 +1,18 @@
 import asyncio
-import base64
 import logging
 import time
 
+import pybase64
 from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from pydantic import BaseModel
-from google import genai
-from google.genai import types as genai_types
 
-from backend.config import GOOGLE_API_KEY
+from backend.responses import OrjsonResponse
+from backend.services.genai_client import get_genai_client
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-_client = genai.Client(api_key=GOOGLE_API_KEY)
 VIDEO_MODEL = "veo-2.0-generate-001"
 
 
@@ -24,18 +22,23 @@ class VideoRequest(BaseModel):
     topic: str = ""
 
 
-@router.post("/api/generate-video")
+@router.post("/generate-video", response_class=OrjsonResponse)
 async def generate_video(request: VideoRequest):
     """Generate a short video from an image using Google Veo.
 
     Takes a base64-encoded image and animates it into a short video clip.
-    Uses polling to wait for the video generation to complete.
+    Uses polling to wait for the video generation to complete. On success the
+    response body is the MP4 itself; errors are returned as JSON.
     """
-    logger.info(f"Video generation request for topic: {request.topic}")
+    logger.info("Video generation request for topic: %s", request.topic)
 
     try:
+        from google.genai import types as genai_types
+
+        client = get_genai_client()
+
         # Decode the base64 image
-        image_bytes = base64.b64decode(request.image_data)
+        image_bytes = pybase64.b64decode(request.image_data)
 
         # Veo requires types.Image, not types.Part
         image = genai_types.Image(image_bytes=image_bytes, mime_type=request.mime_type)
@@ -46,8 +49,9 @@ async def generate_video(request: VideoRequest):
             "Keep it smooth and educational."
         )
 
-        # Start video generation
-        operation = _client.models.generate_videos(
+        # Start video generation (sync SDK call, kept off the event loop)
+        operation = await asyncio.to_thread(
+            client.models.generate_videos,
             model=VIDEO_MODEL,
             prompt=prompt,
             image=image,
@@ -58,40 +62,40 @@ async def generate_video(request: VideoRequest):
             ),
         )
 
-        # Poll until complete (max 180 seconds)
+        # Poll until complete (max 180 seconds), backing off from 1s to 15s
         max_wait = 180
-        start = time.time()
+        delay = 1.0
+        start = time.monotonic()
         while not operation.done:
-            if time.time() - start > max_wait:
-                return JSONResponse(
+            if time.monotonic() - start > max_wait:
+                return OrjsonResponse(
                     content={"status": "error", "message": "Video generation timed out. Please try again."},
                     status_code=504,
                 )
-            await asyncio.sleep(10)
-            operation = _client.operations.get(operation)
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, 15.0)
+            operation = await asyncio.to_thread(client.operations.get, operation)
 
         # Extract the generated video
         if operation.response and operation.response.generated_videos:
             generated_video = operation.response.generated_videos[0]
             # Download the video bytes
-            video_bytes = _client.files.download(file=generated_video.video)
-            video_b64 = base64.b64encode(video_bytes).decode("utf-8")
+            video_bytes = await asyncio.to_thread(
+                client.files.download, file=generated_video.video
+            )
 
-            logger.info(f"Video generated successfully for: {request.topic}")
-            return JSONResponse(content={
-                "status": "success",
-                "video_data": video_b64,
-                "video_mime_type": "video/mp4",
-            })
+            logger.info("Video generated successfully for: %s", request.topic)
+            # Send the MP4 as-is rather than base64 inside JSON
+            return Response(content=video_bytes, media_type="video/mp4")
 
-        return JSONResponse(
+        return OrjsonResponse(
             content={"status": "error", "message": "No video was generated. The content may have been filtered."},
             status_code=500,
         )
 
     except Exception as e:
-        logger.error(f"Video generation error: {e}", exc_info=True)
-        return JSONResponse(
+        logger.error("Video generation error: %s", e, exc_info=True)
+        return OrjsonResponse(
             content={"status": "error", "message": str(e)},
             status_code=500,
         )
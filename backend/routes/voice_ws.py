@@ -1,27 +1,88 @@
 import asyncio
-import json
 import logging
 import re
+from functools import lru_cache
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
-from google.adk.agents.run_config import RunConfig, StreamingMode
-from google.adk.agents.live_request_queue import LiveRequestQueue
-from google.genai import types
 
-from backend.config import APP_NAME
-from backend.encyclopedia_agent import root_agent
+from backend.config import APP_NAME, MAX_VOICE_SESSIONS
+from backend.encyclopedia_agent import get_root_agent
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# Shared services - initialized once at module level
-session_service = InMemorySessionService()
-runner = Runner(
-    app_name=APP_NAME,
-    agent=root_agent,
-    session_service=session_service,
+
+@lru_cache(maxsize=1)
+def _get_runner():
+    """Build the shared ADK runner and session service on first connection.
+
+    Deferred so the ADK stack is not imported and the agent is not
+    constructed until a voice session actually starts.
+    """
+    from google.adk.runners import Runner
+
+    from backend.services.session_service import BoundedSessionService
+
+    return Runner(
+        app_name=APP_NAME,
+        agent=get_root_agent(),
+        session_service=BoundedSessionService(max_sessions=MAX_VOICE_SESSIONS),
+    )
+
+
+def _to_json(message: dict) -> str:
+    """Encode an event for a text frame; orjson returns bytes, frames need str."""
+    return orjson.dumps(message).decode()
+
+
+@lru_cache(maxsize=1)
+def _get_run_config():
+    """Build the bidirectional audio RunConfig once and share it.
+
+    The config is identical for every voice session, so the pydantic models
+    are validated a single time instead of on each connection.
+    """
+    from google.adk.agents.run_config import RunConfig, StreamingMode
+    from google.genai import types
+
+    return RunConfig(
+        streaming_mode=StreamingMode.BIDI,
+        response_modalities=["AUDIO"],
+        speech_config=types.SpeechConfig(
+            voice_config=types.VoiceConfig(
+                prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                    voice_name="Charon",
+                )
+            )
+        ),
+        input_audio_transcription=types.AudioTranscriptionConfig(),
+        output_audio_transcription=types.AudioTranscriptionConfig(),
+    )
+
+
+# Microphone audio format sent by the browser (16-bit PCM, 16kHz, mono)
+_PCM_MIME = "audio/pcm;rate=16000"
+
+# Constant events are encoded once at import rather than per connection
+_VOICE_READY_EVENT = _to_json({
+    "type": "voice_ready",
+    "data": "Voice session established",
+})
+
+
+# Agent reasoning patterns - markdown, tool calls, internal logic - folded into
+# one pass. Tool-ish vocabulary only counts in longer text, so it gets its own
+# superset pattern used when the length guard is met.
+_REASONING_PATTERNS = (
+    r"\*\*.*\*\*"  # **bold markdown**
+    r"|`"  # backtick code references
+    r"|generate_encyclopedia_page"
+    r"|(?i:I've decided|I will now|I'm going to|Let me|I'll proceed)"
+)
+_REASONING_RE = re.compile(_REASONING_PATTERNS)
+_REASONING_LONG_RE = re.compile(
+    _REASONING_PATTERNS + r"|(?i:tool|function|argument|parameter|calling)"
 )
 
 
@@ -33,18 +94,15 @@ def _is_agent_reasoning(text: str) -> bool:
     clean spoken responses to the user.
     """
     t = text.strip()
-    # Agent reasoning patterns - markdown, tool calls, internal logic
-    if re.search(r'\*\*.*\*\*', t):  # **bold markdown**
-        return True
-    if '`' in t:  # backtick code references
-        return True
-    if 'generate_encyclopedia_page' in t:
-        return True
-    if re.search(r"I've decided|I will now|I'm going to|Let me|I'll proceed", t, re.I):
-        return True
-    if re.search(r'tool|function|argument|parameter|calling', t, re.I) and len(t) > 50:
-        return True
-    return False
+    if len(t) > 50:
+        return _REASONING_LONG_RE.search(t) is not None
+    # Most short transcription fragments contain none of the literal markers
+    # the regex needs, so rule them out with plain substring scans first
+    if "*" not in t and "`" not in t and "_" not in t:
+        lowered = t.lower()
+        if "i'" not in lowered and "i will" not in lowered and "let me" not in lowered:
+            return False
+    return _REASONING_RE.search(t) is not None
 
 
 @router.websocket("/ws/voice/{session_id}")
@@ -59,8 +117,13 @@ async def voice_websocket(websocket: WebSocket, session_id: str):
     - Binary messages: PCM audio response (16-bit, 24kHz)
     - Text messages: JSON events (transcriptions, tool status, etc.)
     """
+    from google.adk.agents.live_request_queue import LiveRequestQueue
+    from google.genai import types
+
     await websocket.accept()
     user_id = "default_user"
+    runner = _get_runner()
+    session_service = runner.session_service
 
     try:
         # Create or get session
@@ -72,8 +135,8 @@ async def voice_websocket(websocket: WebSocket, session_id: str):
                 app_name=APP_NAME, user_id=user_id, session_id=session_id
             )
     except Exception as e:
-        logger.error(f"Session creation error: {e}", exc_info=True)
-        await websocket.send_text(json.dumps({
+        logger.error("Session creation error: %s", e, exc_info=True)
+        await websocket.send_text(_to_json({
             "type": "error",
             "data": f"Session error: {str(e)}",
         }))
@@ -81,22 +144,10 @@ async def voice_websocket(websocket: WebSocket, session_id: str):
         return
 
     # Configure for bidirectional audio streaming
-    run_config = RunConfig(
-        streaming_mode=StreamingMode.BIDI,
-        response_modalities=["AUDIO"],
-        speech_config=types.SpeechConfig(
-            voice_config=types.VoiceConfig(
-                prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                    voice_name="Charon",
-                )
-            )
-        ),
-        input_audio_transcription=types.AudioTranscriptionConfig(),
-        output_audio_transcription=types.AudioTranscriptionConfig(),
-    )
+    run_config = _get_run_config()
 
     live_request_queue = LiveRequestQueue()
-    logger.info(f"Voice WebSocket connected for session: {session_id}")
+    logger.info("Voice WebSocket connected for session: %s", session_id)
 
     # Signal to coordinate shutdown between upstream/downstream
     shutdown_event = asyncio.Event()
@@ -104,19 +155,29 @@ async def voice_websocket(websocket: WebSocket, session_id: str):
     async def upstream():
         """Receive audio/text from browser, forward to ADK agent."""
         try:
+            # Read raw ASGI messages: skips Starlette's per-message state
+            # bookkeeping, which matters at ~50 audio frames/s per client
+            receive = websocket._receive
             while not shutdown_event.is_set():
-                raw = await websocket.receive()
+                raw = await receive()
 
-                if "bytes" in raw and raw["bytes"]:
-                    # Binary PCM audio from microphone
-                    audio_blob = types.Blob(
-                        mime_type="audio/pcm;rate=16000",
-                        data=raw["bytes"],
+                if raw["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(raw.get("code", 1000))
+
+                audio = raw.get("bytes")
+                if audio:
+                    # Binary PCM audio from microphone. The fields are known
+                    # good, so skip pydantic validation on every frame
+                    audio_blob = types.Blob.model_construct(
+                        mime_type=_PCM_MIME,
+                        data=audio,
                     )
                     live_request_queue.send_realtime(audio_blob)
+                    continue
 
-                elif "text" in raw and raw["text"]:
-                    msg = json.loads(raw["text"])
+                text = raw.get("text")
+                if text:
+                    msg = orjson.loads(text)
 
                     if msg.get("type") == "text":
                         # Text input (from suggestion chips or typed)
@@ -128,20 +189,25 @@ async def voice_websocket(websocket: WebSocket, session_id: str):
                     # audio_end skipped — native audio model handles VAD automatically
 
         except WebSocketDisconnect:
-            logger.info(f"Upstream disconnected for session: {session_id}")
+            logger.info("Upstream disconnected for session: %s", session_id)
         except Exception as e:
-            logger.error(f"Upstream error: {e}", exc_info=True)
+            logger.error("Upstream error: %s", e, exc_info=True)
         finally:
             shutdown_event.set()
 
     async def downstream():
         """Stream ADK agent events back to browser."""
+        # Audio goes straight to the ASGI send with one reused message dict,
+        # skipping Starlette's per-frame state checks and dict allocation.
+        # Reusing the dict is safe only because this coroutine is the sole
+        # audio sender and awaits each send to completion before refilling it;
+        # the server may await before reading the payload. Never send it from
+        # another task or without awaiting.
+        send = websocket._send
+        audio_message = {"type": "websocket.send", "bytes": None}
         try:
             # Notify client that voice session is ready
-            await websocket.send_text(json.dumps({
-                "type": "voice_ready",
-                "data": "Voice session established",
-            }))
+            await websocket.send_text(_VOICE_READY_EVENT)
 
             async for event in runner.run_live(
                 user_id=user_id,
@@ -152,6 +218,7 @@ async def voice_websocket(websocket: WebSocket, session_id: str):
                 if not event.content or not event.content.parts:
                     continue
 
+                messages = []
                 for part in event.content.parts:
                     # Audio response - send as binary
                     if (
@@ -159,44 +226,55 @@ async def voice_websocket(websocket: WebSocket, session_id: str):
                         and part.inline_data.mime_type
                         and "audio" in part.inline_data.mime_type
                     ):
-                        await websocket.send_bytes(part.inline_data.data)
+                        audio_message["bytes"] = part.inline_data.data
+                        try:
+                            await send(audio_message)
+                        except OSError:
+                            # What Starlette's send_bytes would raise for a
+                            # client that has gone away
+                            raise WebSocketDisconnect(code=1006)
                         continue
 
                     # Text part - filter out agent reasoning, only send clean speech
                     if part.text and not _is_agent_reasoning(part.text):
-                        await websocket.send_text(
-                            json.dumps({
-                                "type": "transcription",
-                                "data": part.text,
-                                "is_output": True,
-                            })
-                        )
+                        messages.append({
+                            "type": "transcription",
+                            "data": part.text,
+                            "is_output": True,
+                        })
 
                 # Send transcription events
                 if hasattr(event, "input_transcription") and event.input_transcription:
-                    await websocket.send_text(
-                        json.dumps({
-                            "type": "input_transcription",
-                            "data": event.input_transcription,
-                            "partial": getattr(event, "partial", False),
-                        })
-                    )
+                    messages.append({
+                        "type": "input_transcription",
+                        "data": event.input_transcription,
+                        "partial": getattr(event, "partial", False),
+                    })
 
                 if hasattr(event, "output_transcription") and event.output_transcription:
+                    messages.append({
+                        "type": "output_transcription",
+                        "data": event.output_transcription,
+                    })
+
+                # One text frame per ADK event; audio above is never delayed
+                if len(messages) == 1:
+                    await websocket.send_text(_to_json(messages[0]))
+                elif messages:
                     await websocket.send_text(
-                        json.dumps({
-                            "type": "output_transcription",
-                            "data": event.output_transcription,
-                        })
+                        _to_json({"type": "batch", "messages": messages})
                     )
 
         except WebSocketDisconnect:
-            logger.info(f"Downstream disconnected for session: {session_id}")
+            logger.info("Downstream disconnected for session: %s", session_id)
+        except asyncio.CancelledError:
+            logger.info("Downstream cancelled for session: %s", session_id)
+            raise
         except Exception as e:
-            logger.error(f"Downstream error: {e}", exc_info=True)
+            logger.error("Downstream error: %s", e, exc_info=True)
             # Send error to client so they know what happened
             try:
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(_to_json({
                     "type": "error",
                     "data": f"Voice stream error: {str(e)}",
                 }))
@@ -205,8 +283,14 @@ async def voice_websocket(websocket: WebSocket, session_id: str):
         finally:
             shutdown_event.set()
 
+    tasks = {asyncio.create_task(upstream()), asyncio.create_task(downstream())}
     try:
-        await asyncio.gather(upstream(), downstream())
+        # Whichever side finishes first ends the session. The other is
+        # cancelled so run_live is torn down without waiting for its next event
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
     finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
         live_request_queue.close()
-        logger.info(f"Voice WebSocket closed for session: {session_id}")
+        logger.info("Voice WebSocket closed for session: %s", session_id)
@@ -1,38 +1,113 @@
 import asyncio
-from collections import defaultdict
+from collections import deque
 from typing import Any
 
 
+class _Channel:
+    """Shared broadcast buffer for one session."""
+
+    __slots__ = ("buffer", "event", "seq", "subscribers")
+
+    def __init__(self, max_pending: int):
+        self.buffer: deque = deque(maxlen=max_pending)
+        self.event = asyncio.Event()
+        # Seq of the newest message in the buffer
+        self.seq = 0
+        self.subscribers: set[Subscription] = set()
+
+    def trim(self):
+        """Drop buffered messages that every subscriber has already read."""
+        if not self.subscribers:
+            self.buffer.clear()
+            return
+        slowest = min(subscription._cursor for subscription in self.subscribers)
+        for _ in range(len(self.buffer) - (self.seq - slowest)):
+            self.buffer.popleft()
+
+
+class Subscription:
+    """A subscriber's read cursor into a session's broadcast buffer.
+
+    Mirrors the asyncio.Queue read API (``get`` / ``get_nowait``). A reader
+    that falls more than the buffer length behind skips ahead to the oldest
+    retained message; the jump is visible as a gap in the ``seq`` field.
+    """
+
+    def __init__(self, channel: _Channel):
+        self._channel = channel
+        # Seq of the last message this subscriber has read
+        self._cursor = channel.seq
+
+    def get_nowait(self) -> Any:
+        """Return the next unread message, or raise asyncio.QueueEmpty."""
+        channel = self._channel
+        if self._cursor >= channel.seq:
+            raise asyncio.QueueEmpty
+        oldest = channel.seq - len(channel.buffer) + 1
+        seq = max(self._cursor + 1, oldest)
+        self._cursor = seq
+        message = channel.buffer[seq - oldest]
+        if seq == oldest:
+            # This may have been the last reader holding the oldest messages
+            channel.trim()
+        return message
+
+    async def get(self) -> Any:
+        """Wait for and return the next unread message."""
+        while self._cursor >= self._channel.seq:
+            await self._channel.event.wait()
+        return self.get_nowait()
+
+
 class ContentStore:
     """In-memory pub/sub for delivering encyclopedia pages to content WebSockets.
 
     When the encyclopedia tool generates a page, it publishes the data here.
     Content WebSocket connections subscribe to receive pages for their session.
+
+    Each session has one bounded broadcast buffer shared by all of its
+    subscribers, so publishing costs the same however many are listening.
+    A message is released once every subscriber has read it.
+    Dict payloads are stamped with a per-session ``seq`` so a slow consumer
+    can detect messages that were overwritten before it read them.
     """
 
-    def __init__(self):
-        self._subscribers: dict[str, list[asyncio.Queue]] = defaultdict(list)
-
-    def subscribe(self, session_id: str) -> asyncio.Queue:
-        """Subscribe to content updates for a session. Returns a Queue to await on."""
-        queue: asyncio.Queue = asyncio.Queue()
-        self._subscribers[session_id].append(queue)
-        return queue
-
-    def unsubscribe(self, session_id: str, queue: asyncio.Queue):
-        """Remove a subscriber queue for a session."""
-        if session_id in self._subscribers:
-            try:
-                self._subscribers[session_id].remove(queue)
-            except ValueError:
-                pass
-            if not self._subscribers[session_id]:
-                del self._subscribers[session_id]
+    def __init__(self, max_pending: int = 64):
+        self._max_pending = max_pending
+        self._channels: dict[str, _Channel] = {}
+
+    def subscribe(self, session_id: str) -> Subscription:
+        """Subscribe to content updates for a session. Returns a Subscription to await on."""
+        channel = self._channels.get(session_id)
+        if channel is None:
+            channel = self._channels[session_id] = _Channel(self._max_pending)
+        subscription = Subscription(channel)
+        channel.subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, session_id: str, subscription: Subscription):
+        """Remove a subscriber for a session."""
+        channel = self._channels.get(session_id)
+        if channel is None:
+            return
+        channel.subscribers.discard(subscription)
+        if not channel.subscribers:
+            del self._channels[session_id]
+        else:
+            channel.trim()
 
     def publish(self, session_id: str, data: Any):
         """Publish content data to all subscribers of a session."""
-        for queue in self._subscribers.get(session_id, []):
-            queue.put_nowait(data)
+        channel = self._channels.get(session_id)
+        if channel is None:
+            return
+        channel.seq += 1
+        if isinstance(data, dict):
+            data = {**data, "seq": channel.seq}
+        channel.buffer.append(data)
+        # Wake every waiting subscriber, then re-arm for the next publish
+        channel.event.set()
+        channel.event.clear()
 
 
 content_store = ContentStore()
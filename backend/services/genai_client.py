@@ -0,0 +1,16 @@
+from functools import lru_cache
+
+from backend.config import GOOGLE_API_KEY
+
+
+@lru_cache(maxsize=1)
+def get_genai_client():
+    """Return the process-wide genai client, creating it on first use.
+
+    Every route and tool shares this one client, and with it a single
+    connection pool and auth path. The SDK import is deferred so that it
+    does not slow down server start-up.
+    """
+    from google import genai
+
+    return genai.Client(api_key=GOOGLE_API_KEY)
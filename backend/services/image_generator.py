@@ -1,10 +1,7 @@
-import base64
 import logging
 
-from google import genai
-from google.genai import types
-
-from backend.config import IMAGE_GEN_MODEL, GOOGLE_API_KEY
+from backend.config import IMAGE_GEN_MODEL
+from backend.services.genai_client import get_genai_client
 
 logger = logging.getLogger(__name__)
 
@@ -13,39 +10,64 @@ class ImageGenerator:
     """Wraps the Google GenAI SDK for interleaved text + image generation."""
 
     def __init__(self):
-        self.client = genai.Client(api_key=GOOGLE_API_KEY)
+        # Request configs are immutable per aspect ratio, so build each once
+        self._config_cache: dict = {}
+
+    @property
+    def client(self):
+        """The shared genai client."""
+        return get_genai_client()
 
-    def generate_interleaved(
+    async def generate_interleaved(
         self, prompt: str, aspect_ratio: str = "16:9"
     ) -> list[dict]:
         """Generate interleaved text + images from a prompt.
 
+        Streams the response on the async client. Images are returned as raw
+        bytes, not base64.
+
         Returns a list of parts, each being either:
           {"type": "text", "content": "..."}
-          {"type": "image", "data": "<base64>", "mime_type": "image/png"}
+          {"type": "image", "data": b"<raw bytes>", "mime_type": "image/png"}
         """
-        response = self.client.models.generate_content(
-            model=IMAGE_GEN_MODEL,
-            contents=prompt,
-            config=types.GenerateContentConfig(
+        from google.genai import types
+
+        config = self._config_cache.get(aspect_ratio)
+        if config is None:
+            config = self._config_cache[aspect_ratio] = types.GenerateContentConfig(
                 response_modalities=["TEXT", "IMAGE"],
                 image_config=types.ImageConfig(aspect_ratio=aspect_ratio),
-            ),
+            )
+
+        stream = await self.client.aio.models.generate_content_stream(
+            model=IMAGE_GEN_MODEL,
+            contents=prompt,
+            config=config,
         )
 
+        # Streamed text arrives in fragments; collect each run and join it once
         parts = []
-        for part in response.parts:
-            if part.text is not None:
-                parts.append({"type": "text", "content": part.text})
-            elif part.inline_data is not None:
-                img_b64 = base64.b64encode(part.inline_data.data).decode("utf-8")
-                parts.append(
-                    {
-                        "type": "image",
-                        "data": img_b64,
-                        "mime_type": part.inline_data.mime_type or "image/png",
-                    }
-                )
+        text_run: list[str] = []
+
+        def finish_text():
+            if text_run:
+                parts.append({"type": "text", "content": "".join(text_run)})
+                text_run.clear()
+
+        async for chunk in stream:
+            for part in chunk.parts or ():
+                if part.text is not None:
+                    text_run.append(part.text)
+                elif part.inline_data is not None:
+                    finish_text()
+                    parts.append(
+                        {
+                            "type": "image",
+                            "data": part.inline_data.data,
+                            "mime_type": part.inline_data.mime_type or "image/png",
+                        }
+                    )
+        finish_text()
         return parts
 
 
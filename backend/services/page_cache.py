@@ -0,0 +1,98 @@
+import asyncio
+from typing import Awaitable, Callable
+
+from cachetools import TTLCache
+
+from backend.config import PAGE_CACHE_MAX_MB, PAGE_CACHE_TTL
+
+
+def _page_size(page_data: dict) -> int:
+    """Approximate a page's memory footprint by its text and image bytes."""
+    return 1 + sum(
+        len(section["text"]) + sum(len(img["data"]) for img in section["images"])
+        for section in page_data["sections"]
+    )
+
+
+class PageCache:
+    """In-memory TTL + LRU cache of generated pages keyed by (topic, focus).
+
+    Repeat requests for the same topic (suggestion chips, voice demos) are
+    served without calling Gemini. The cache is bounded by total page size
+    rather than entry count, since pages carry raw image bytes. It is only
+    touched from the event loop, so no locking is needed.
+
+    Concurrent misses for the same key are collapsed: only the first caller
+    generates the page and the others await its result.
+    """
+
+    def __init__(self, max_bytes: int, ttl_seconds: int):
+        self._pages: TTLCache = TTLCache(
+            maxsize=max_bytes, ttl=ttl_seconds, getsizeof=_page_size
+        )
+        self._inflight: dict[tuple[str, str], asyncio.Task] = {}
+
+    @staticmethod
+    def _key(topic: str, focus: str) -> tuple[str, str]:
+        return topic.strip().lower(), focus.strip().lower()
+
+    def put(self, topic: str, focus: str, page_data: dict):
+        """Cache a generated page.
+
+        Empty pages (e.g. a safety-blocked or truncated stream) are not cached
+        so the next request retries, and pages larger than the whole cache
+        are skipped.
+        """
+        if not page_data["sections"]:
+            return
+        try:
+            self._pages[self._key(topic, focus)] = page_data
+        except ValueError:
+            pass
+
+    async def _generate(
+        self,
+        key: tuple[str, str],
+        topic: str,
+        focus: str,
+        create: Callable[[], Awaitable[dict]],
+    ) -> dict:
+        """Run ``create`` and cache its page; owned by a detached task."""
+        try:
+            page_data = await create()
+        finally:
+            del self._inflight[key]
+        self.put(topic, focus, page_data)
+        return page_data
+
+    async def get_or_create(
+        self, topic: str, focus: str, create: Callable[[], Awaitable[dict]]
+    ) -> tuple[dict, bool]:
+        """Return the page for a topic, generating it with ``create`` on a miss.
+
+        Returns ``(page_data, created)``; ``created`` is True only for the
+        caller whose ``create`` actually ran. If a generation for the same
+        key is already in flight, this waits for it instead of starting
+        another one.
+
+        Generation runs in its own task and every caller awaits it through
+        ``asyncio.shield``, so a caller being cancelled (e.g. its voice
+        session disconnecting) neither cancels it for the others nor stops
+        the finished page from being cached.
+        """
+        key = self._key(topic, focus)
+        page_data = self._pages.get(key)
+        if page_data is not None:
+            return page_data, False
+
+        task = self._inflight.get(key)
+        created = task is None
+        if created:
+            task = asyncio.create_task(self._generate(key, topic, focus, create))
+            self._inflight[key] = task
+        return await asyncio.shield(task), created
+
+
+page_cache = PageCache(
+    max_bytes=PAGE_CACHE_MAX_MB * 1024 * 1024, ttl_seconds=PAGE_CACHE_TTL
+)
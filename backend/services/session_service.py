@@ -0,0 +1,51 @@
+from collections import OrderedDict
+from typing import Any
+
+from google.adk.sessions import InMemorySessionService
+
+
+class BoundedSessionService(InMemorySessionService):
+    """InMemorySessionService that evicts least recently used sessions.
+
+    Every browser tab (and every reload) opens a new voice session, and the
+    stock service keeps them all for the life of the process. Sessions are
+    tracked in access order and the oldest are deleted once ``max_sessions``
+    is exceeded.
+    """
+
+    def __init__(self, max_sessions: int):
+        super().__init__()
+        self._max_sessions = max_sessions
+        # (app_name, user_id, session_id) in least- to most-recently used order
+        self._lru: OrderedDict[tuple[str, str, str], None] = OrderedDict()
+
+    async def create_session(self, *, app_name: str, user_id: str, **kwargs: Any):
+        session = await super().create_session(
+            app_name=app_name, user_id=user_id, **kwargs
+        )
+        self._lru[(app_name, user_id, session.id)] = None
+        while len(self._lru) > self._max_sessions:
+            (old_app, old_user, old_id), _ = self._lru.popitem(last=False)
+            await super().delete_session(
+                app_name=old_app, user_id=old_user, session_id=old_id
+            )
+        return session
+
+    async def get_session(
+        self, *, app_name: str, user_id: str, session_id: str, **kwargs: Any
+    ):
+        session = await super().get_session(
+            app_name=app_name, user_id=user_id, session_id=session_id, **kwargs
+        )
+        key = (app_name, user_id, session_id)
+        if session is not None and key in self._lru:
+            self._lru.move_to_end(key)
+        return session
+
+    async def delete_session(
+        self, *, app_name: str, user_id: str, session_id: str, **kwargs: Any
+    ):
+        self._lru.pop((app_name, user_id, session_id), None)
+        await super().delete_session(
+            app_name=app_name, user_id=user_id, session_id=session_id, **kwargs
+        )
@@ -25,6 +25,8 @@ class App {
     constructor() {
         this.sessionId = crypto.randomUUID();
         this.pageCache = {};  // cacheKey -> pageData
+        this.streamingPages = {};  // topic -> pageData still receiving sections
+        this.pendingImages = {};   // image ref -> bytes from a binary content frame
         this.tabs = [];       // [{ id, topic, pageData, loading }]
         this.activeTabId = null;
 
@@ -75,12 +77,19 @@ class App {
         const url = `${protocol}//${location.host}/ws/content/${this.sessionId}`;
 
         this.contentWs = new WebSocket(url);
+        this.contentWs.binaryType = 'arraybuffer';
 
         this.contentWs.onmessage = (event) => {
+            if (event.data instanceof ArrayBuffer) {
+                this._onImageFrame(event.data);
+                return;
+            }
             try {
                 const data = JSON.parse(event.data);
-                if (data.type === 'encyclopedia_page') {
-                    this._onPageReceived(data);
+                if (data.type === 'batch') {
+                    data.messages.forEach((message) => this._handleContentMessage(message));
+                } else {
+                    this._handleContentMessage(data);
                 }
             } catch (e) {
                 console.error('Failed to parse content:', e);
@@ -92,6 +101,32 @@ class App {
         };
     }
 
+    /**
+     * Dispatch a single content message by type.
+     */
+    _handleContentMessage(data) {
+        if (data.type === 'encyclopedia_page') {
+            this._onPageReceived(data);
+        } else if (data.type === 'section_delta') {
+            this._onSectionDelta(data);
+        } else if (data.type === 'encyclopedia_page_complete') {
+            this._onPageComplete(data);
+        } else if (data.type === 'gap') {
+            this._onContentGap(data);
+        }
+    }
+
+    /**
+     * The server dropped messages because we fell behind. Any page still
+     * streaming may be missing sections, so keep it out of the page cache.
+     */
+    _onContentGap(data) {
+        console.warn(`Content stream dropped ${data.dropped} message(s)`);
+        for (const pageData of Object.values(this.streamingPages)) {
+            pageData.incomplete = true;
+        }
+    }
+
     /**
      * Set up voice manager callbacks.
      */
@@ -547,6 +582,72 @@ class App {
         this._createTab(pageData.topic, pageData);
     }
 
+    /**
+     * Stash raw image bytes from a binary content frame until the section
+     * that references them arrives. Frame layout: "IMG\0" + ref + "\0" + bytes.
+     */
+    _onImageFrame(buffer) {
+        const bytes = new Uint8Array(buffer);
+        const refEnd = bytes.indexOf(0, 4);
+        if (refEnd === -1) return;
+        const ref = new TextDecoder().decode(bytes.subarray(4, refEnd));
+        this.pendingImages[ref] = bytes.subarray(refEnd + 1);
+    }
+
+    /**
+     * Replace image refs in a streamed section with blobs and object URLs.
+     */
+    _resolveImages(section) {
+        for (const img of section.images || []) {
+            if (!img.ref) continue;
+            const bytes = this.pendingImages[img.ref];
+            delete this.pendingImages[img.ref];
+            if (!bytes) continue;
+            img.blob = new Blob([bytes], { type: img.mime_type });
+            img.url = URL.createObjectURL(img.blob);
+        }
+    }
+
+    /**
+     * Handle one streamed section of a page (from content WebSocket).
+     * The first section opens the tab; later ones are appended in place.
+     */
+    _onSectionDelta(data) {
+        this._resolveImages(data.section);
+        const key = data.topic.toLowerCase();
+        let pageData = this.streamingPages[key];
+
+        if (!pageData || data.index === 0) {
+            pageData = {
+                type: 'encyclopedia_page',
+                topic: data.topic,
+                focus: data.focus,
+                sections: [data.section],
+            };
+            this.streamingPages[key] = pageData;
+            this._onPageReceived(pageData);
+            return;
+        }
+
+        pageData.sections.push(data.section);
+        const tab = this.tabs.find((t) => t.pageData === pageData);
+        if (tab && this.activeTabId === tab.id) {
+            this.renderer.appendSection(data.section, data.index);
+        }
+    }
+
+    /**
+     * Handle the end-of-page sentinel for a streamed page.
+     */
+    _onPageComplete(data) {
+        const key = data.topic.toLowerCase();
+        const pageData = this.streamingPages[key];
+        if (!pageData) return;
+        delete this.streamingPages[key];
+        if (pageData.incomplete) return;
+        this.pageCache[`${key}|${(data.focus || '').toLowerCase()}`] = pageData;
+    }
+
     /**
      * Create a completed tab for a topic (for cached content).
      */
@@ -645,9 +746,21 @@ class App {
         }
     }
 
+    /**
+     * Read a Blob as a base64 string (without the data: URL prefix).
+     */
+    _blobToBase64(blob) {
+        return new Promise((resolve, reject) => {
+            const reader = new FileReader();
+            reader.onload = () => resolve(reader.result.split(',', 2)[1]);
+            reader.onerror = () => reject(reader.error);
+            reader.readAsDataURL(blob);
+        });
+    }
+
     /**
      * Generate a video from an image using Veo, replacing the image in-place.
-     * @param {string} imageData - base64 image data
+     * @param {string|Blob} imageData - base64 image data or raw image Blob
      * @param {string} mimeType - image MIME type
      * @param {string} topic - topic for animation prompt
      * @param {HTMLElement} imageWrapper - the .image-wrapper element containing the image
@@ -671,6 +784,9 @@ class App {
         if (videoBtn) videoBtn.style.display = 'none';
 
         try {
+            if (imageData instanceof Blob) {
+                imageData = await this._blobToBase64(imageData);
+            }
             const response = await fetch('/api/generate-video', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
@@ -681,7 +797,11 @@ class App {
                 }),
             });
 
-            const result = await response.json();
+            // Success streams back the MP4 itself; errors come back as JSON
+            const contentType = response.headers.get('Content-Type') || '';
+            const result = contentType.startsWith('video/')
+                ? { videoUrl: URL.createObjectURL(await response.blob()) }
+                : await response.json();
 
             if (result.status === 'error') {
                 overlay.innerHTML = `
@@ -692,7 +812,7 @@ class App {
                     overlay.remove();
                     if (videoBtn) videoBtn.style.display = '';
                 }, 3000);
-            } else if (result.video_data) {
+            } else if (result.videoUrl) {
                 // Replace the image with a video element
                 overlay.remove();
                 const img = imageWrapper.querySelector('.encyclopedia-image');
@@ -702,10 +822,7 @@ class App {
                     video.autoplay = true;
                     video.loop = true;
                     video.className = 'encyclopedia-image encyclopedia-video';
-                    video.innerHTML = `
-                        <source src="data:${result.video_mime_type || 'video/mp4'};base64,${result.video_data}"
-                                type="${result.video_mime_type || 'video/mp4'}">
-                    `;
+                    video.innerHTML = `<source src="${result.videoUrl}" type="${contentType}">`;
                     img.replaceWith(video);
                 }
                 // Remove the video button since we already have the video
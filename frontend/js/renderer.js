@@ -1,7 +1,7 @@
 /**
  * Encyclopedia Page Renderer
  *
- * Transforms JSON encyclopedia data (sections of text + base64 images)
+ * Transforms JSON encyclopedia data (sections of text + base64 or blob images)
  * into a rich, visual layout. The entire page is click-to-explore:
  * click any text or image to generate a detailed page about that subject.
  */
@@ -114,6 +114,25 @@ export class EncyclopediaRenderer {
         this.container.scrollIntoView({ behavior: 'smooth', block: 'start' });
     }
 
+    /**
+     * Append one streamed section to the page currently on screen.
+     * @param {Object} section - { text, images }
+     * @param {number} index - position of the section within the page
+     */
+    appendSection(section, index) {
+        const extracted = this._extractRelatedTopics(section.text);
+        if (extracted.topics.length > 0) {
+            if (extracted.remainingText.trim().length >= 20) {
+                section = { ...section, text: extracted.remainingText };
+                this.container.appendChild(this._renderSection(section, index));
+            }
+            this.container.appendChild(this._renderRelatedTopics(extracted.topics));
+            return;
+        }
+
+        this.container.appendChild(this._renderSection(section, index));
+    }
+
     /**
      * Render a single section with text and/or images.
      */
@@ -202,7 +221,7 @@ export class EncyclopediaRenderer {
                 wrapper.className = 'image-wrapper clickable-area';
 
                 const imgEl = document.createElement('img');
-                imgEl.src = `data:${img.mime_type};base64,${img.data}`;
+                imgEl.src = img.url || `data:${img.mime_type};base64,${img.data}`;
                 imgEl.className = 'encyclopedia-image';
                 imgEl.loading = 'lazy';
                 imgEl.alt = `Illustration for encyclopedia content`;
@@ -250,7 +269,7 @@ export class EncyclopediaRenderer {
                             if (!this._isGenericHeading(t)) { topic = t; break; }
                         }
                         if (!topic) topic = this._extractTopicFromText(section.text);
-                        this.onVideoRequest(img.data, img.mime_type, topic || 'this image', wrapper);
+                        this.onVideoRequest(img.data || img.blob, img.mime_type, topic || 'this image', wrapper);
                     }
                 });
                 wrapper.appendChild(videoBtn);
@@ -69,7 +69,11 @@ export class VoiceManager {
                 // JSON event
                 try {
                     const data = JSON.parse(event.data);
-                    this._handleEvent(data);
+                    if (data.type === 'batch') {
+                        data.messages.forEach((message) => this._handleEvent(message));
+                    } else {
+                        this._handleEvent(data);
+                    }
                 } catch (e) {
                     console.warn('Failed to parse voice event:', e);
                 }
@@ -259,9 +263,10 @@ export class VoiceManager {
                 await this.playbackContext.resume();
             }
 
-            // Send Int16 samples to the player worklet
+            // Send Int16 samples to the player worklet, transferring the
+            // buffer instead of structured-cloning a copy of it
             const int16Samples = new Int16Array(pcmArrayBuffer);
-            this.playerNode.port.postMessage({ samples: int16Samples });
+            this.playerNode.port.postMessage({ samples: int16Samples }, [int16Samples.buffer]);
         } catch (err) {
             console.error('Audio playback error:', err);
         }